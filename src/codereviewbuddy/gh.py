@@ -40,6 +40,27 @@ def _git_root_for_cwd(cwd: str) -> str | None:
     return None
 
 
+def _current_branch(cwd: str | None) -> str | None:
+    """Return the checked-out branch for ``cwd``, or ``None`` if detached or not in a repo."""
+    git = shutil.which("git")
+    if not git:
+        return None
+    try:
+        result = subprocess.run(  # noqa: S603
+            [git, "symbolic-ref", "--quiet", "--short", "HEAD"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=10,
+        )
+        if result.returncode == 0:
+            return result.stdout.strip() or None
+    except Exception as exc:
+        logger.debug("git symbolic-ref failed in %s: %s", cwd, exc)
+    return None
+
+
 class GhError(Exception):
     """Raised when a gh CLI command fails."""
 
@@ -232,6 +253,9 @@ def get_current_pr_number(cwd: str | None = None) -> int:
     """Detect the PR number associated with the current git branch.
 
     Uses ``gh pr view`` which resolves the current branch to its open PR.
+    The result is cached per (cwd, branch) for the cache TTL, so a run of
+    tool calls from the same branch costs one ``gh pr view`` — switching
+    branches changes the key. Detached HEADs are never cached.
 
     Returns:
         The PR number.
@@ -239,8 +263,17 @@ def get_current_pr_number(cwd: str | None = None) -> int:
     Raises:
         GhError: If no PR is associated with the current branch.
     """
+    branch = _current_branch(cwd)
+    key = cache.make_key("current_pr", cwd, branch) if branch else None
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not cache._SENTINEL:
+            return cached
     raw = run_gh("pr", "view", "--json", "number", "-q", ".number", cwd=cwd)
-    return int(raw.strip())
+    number = int(raw.strip())
+    if key is not None:
+        cache.put(key, number)
+    return number
 
 
 def parse_repo(repo: str) -> tuple[str, str]:
@@ -262,10 +295,19 @@ def parse_repo(repo: str) -> tuple[str, str]:
 def get_repo_info(cwd: str | None = None) -> tuple[str, str]:
     """Get the owner and repo name for the current repository.
 
+    ``gh repo view`` spawns a process and makes an API round-trip, and
+    every tool call without an explicit ``repo`` needs this, so the result
+    is cached per cwd for the cache TTL.
+
     Returns:
         Tuple of (owner, repo).
     """
+    key = cache.make_key("repo_info", cwd)
+    cached = cache.get(key)
+    if cached is not cache._SENTINEL:
+        return cached
     raw = run_gh("repo", "view", "--json", "nameWithOwner", "-q", ".nameWithOwner", cwd=cwd)
     owner_repo = raw.strip()
     owner, repo = owner_repo.split("/", 1)
+    cache.put(key, (owner, repo))
     return owner, repo
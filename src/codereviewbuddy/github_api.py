@@ -19,7 +19,7 @@ import subprocess  # noqa: S404
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Sequence
 
 import httpx
 
@@ -28,12 +28,16 @@ from codereviewbuddy import cache
 logger = logging.getLogger(__name__)
 
 _GITHUB_API_TIMEOUT_SECS = 30.0
+_MAX_CONCURRENT_REQUESTS = 6
 _GITHUB_API_URL = "https://api.github.com"
 _GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
 TOKEN_CREATE_URL = "https://github.com/settings/tokens/new?scopes=repo&description=codereviewbuddy"  # noqa: S105
 
 _token: str | None = None
 _token_resolved: bool = False
+_token_task: asyncio.Future[str | None] | None = None
+_request_slots: asyncio.Semaphore | None = None
+_request_slots_loop: asyncio.AbstractEventLoop | None = None
 
 
 # ---------------------------------------------------------------------------
@@ -119,13 +123,26 @@ def _resolve_token_sync() -> str | None:
 async def get_token() -> str:
     """Return the GitHub token, resolving it lazily on first call.
 
+    Concurrent first callers share a single resolution, so a cold fan-out
+    spawns one ``gh auth token`` rather than one per request.
+
     Raises:
         GitHubAuthError: If no token can be found.
     """
-    global _token, _token_resolved  # noqa: PLW0603
+    global _token, _token_resolved, _token_task  # noqa: PLW0603
     if not _token_resolved:
-        _token = await asyncio.to_thread(_resolve_token_sync)
+        if _token_task is None:
+            _token_task = asyncio.ensure_future(asyncio.to_thread(_resolve_token_sync))
+        task = _token_task
+        try:
+            # shield: a cancelled caller must not cancel the shared lookup
+            _token = await asyncio.shield(task)
+        except Exception:
+            if _token_task is task:
+                _token_task = None  # a failed lookup is retried on the next call
+            raise
         _token_resolved = True
+        _token_task = None
     if _token is None:
         raise GitHubAuthError
     return _token
@@ -133,9 +150,10 @@ async def get_token() -> str:
 
 def reset_token() -> None:
     """Reset cached token (for testing)."""
-    global _token, _token_resolved  # noqa: PLW0603
+    global _token, _token_resolved, _token_task  # noqa: PLW0603
     _token = None
     _token_resolved = False
+    _token_task = None
 
 
 # ---------------------------------------------------------------------------
@@ -222,6 +240,81 @@ async def _httpx_request(
             pass
 
 
+# ---------------------------------------------------------------------------
+# Concurrent fan-out
+# ---------------------------------------------------------------------------
+
+
+def _get_request_slots() -> asyncio.Semaphore:
+    """Return the fan-out semaphore shared by every caller on the running loop.
+
+    Created lazily because an ``asyncio.Semaphore`` binds to the loop it is
+    first contended on; a new loop (e.g. per test) gets a fresh one.
+    """
+    global _request_slots, _request_slots_loop  # noqa: PLW0603
+    loop = asyncio.get_running_loop()
+    if _request_slots is None or _request_slots_loop is not loop:
+        _request_slots = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        _request_slots_loop = loop
+    return _request_slots
+
+
+async def gather_limited[T, R](
+    fn: Callable[[T], Awaitable[R]],
+    items: Sequence[T],
+    *,
+    progress: Callable[[int, int], Awaitable[object]] | None = None,
+) -> list[R]:
+    """Run ``fn(item)`` for every item concurrently, returning results in input order.
+
+    At most ``_MAX_CONCURRENT_REQUESTS`` calls are in flight at once across all
+    concurrent fan-outs, which keeps parallel tool calls well clear of GitHub's
+    secondary rate limits. Each coroutine is only created once it gets a slot,
+    so nothing is left un-awaited if a sibling fails — the first exception
+    cancels the rest and propagates. Because the slots are shared, ``fn`` must
+    not itself fan out through ``gather_limited`` — nested fan-outs can
+    deadlock waiting on each other.
+
+    Args:
+        fn: Async callable applied to each item.
+        items: Inputs, typically PR numbers.
+        progress: Optional ``(done, total)`` callback such as
+            ``ctx.report_progress`` — called with ``0`` up front and again
+            as each call completes.
+    """
+    total = len(items)
+    semaphore = _get_request_slots()
+    done = 0
+    failed = False
+
+    async def _run(item: T) -> R:
+        nonlocal done, failed
+        async with semaphore:
+            if failed:
+                # A sibling failed while we waited for a slot — don't start new work
+                raise asyncio.CancelledError
+            try:
+                result = await fn(item)
+            except BaseException:
+                failed = True  # set before the slot is released to the next waiter
+                raise
+        done += 1
+        if progress is not None:
+            await progress(done, total)
+        return result
+
+    if progress is not None and total:
+        await progress(0, total)
+
+    tasks = [asyncio.ensure_future(_run(item)) for item in items]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
 # ---------------------------------------------------------------------------
 # GraphQL
 # ---------------------------------------------------------------------------
@@ -279,6 +372,50 @@ async def graphql(query: str, variables: dict[str, Any] | None = None) -> dict[s
     return result
 
 
+# ---------------------------------------------------------------------------
+# Conditional GETs (ETag)
+# ---------------------------------------------------------------------------
+
+_HTTP_NOT_MODIFIED = 304
+_MAX_ETAG_ENTRIES = 256
+
+# Last ETag, parsed body and Link header per GET; 304s don't count against the rate limit
+_etags: dict[str, tuple[str, Any, str]] = {}
+
+
+def _with_etag(headers: dict[str, str], entry: tuple[str, Any, str] | None) -> dict[str, str]:
+    """Return ``headers`` plus ``If-None-Match`` when a stored ETag ``entry`` exists."""
+    if entry is None:
+        return headers
+    return {**headers, "If-None-Match": entry[0]}
+
+
+def _read_conditional(response: httpx.Response, key: str, entry: tuple[str, Any, str] | None) -> tuple[Any, str]:
+    """Return ``(body, link_header)`` for a GET, reusing the stored copy on ``304 Not Modified``.
+
+    Complements the short TTL cache: once an entry expires, re-polling an
+    unchanged resource costs a 304 instead of a full response and rate-limit quota.
+    ``entry`` is the one the request was conditioned on — concurrent requests
+    may evict it from ``_etags`` while this one is in flight.
+    """
+    if response.status_code == _HTTP_NOT_MODIFIED and entry is not None:
+        return entry[1], entry[2]
+    _raise_for_status(response)
+    body = response.json() if response.content else None
+    link = response.headers.get("link", "")
+    etag = response.headers.get("etag")
+    if etag:
+        if key not in _etags and len(_etags) >= _MAX_ETAG_ENTRIES:
+            del _etags[next(iter(_etags))]  # evict the oldest entry
+        _etags[key] = (etag, body, link)
+    return body, link
+
+
+def reset_etags() -> None:
+    """Forget stored ETags (for testing)."""
+    _etags.clear()
+
+
 # ---------------------------------------------------------------------------
 # REST
 # ---------------------------------------------------------------------------
@@ -339,12 +476,18 @@ async def _single_rest(url: str, method: str, headers: dict[str, str], **kwargs:
     upper = method.upper()
     params = dict(kwargs) if upper == "GET" and kwargs else None
     json_body = dict(kwargs) if upper != "GET" and kwargs else None
+    etag_key = cache.make_key("etag", url, params) if upper == "GET" else None
+    etag_entry = _etags.get(etag_key) if etag_key is not None else None
+    headers = _with_etag(headers, etag_entry)
 
     response = await _httpx_request(
         lambda client: client.request(method, url, headers=headers, params=params, json=json_body),
         timeout_msg=f"GitHub REST API timed out after {_GITHUB_API_TIMEOUT_SECS:.0f}s",
     )
 
+    if etag_key is not None:
+        body, _link = _read_conditional(response, etag_key, etag_entry)
+        return body
     _raise_for_status(response)
     if not response.content:
         return None
@@ -361,19 +504,20 @@ async def _paginate_rest(url: str, headers: dict[str, str], **kwargs: Any) -> li
     try:
         while next_url:
             params = dict(kwargs) if first and kwargs else None
+            etag_key = cache.make_key("etag", next_url, params)
+            etag_entry = _etags.get(etag_key)
             try:
                 async with asyncio.timeout(_GITHUB_API_TIMEOUT_SECS):
-                    response = await client.get(next_url, headers=headers, params=params)
+                    response = await client.get(next_url, headers=_with_etag(headers, etag_entry), params=params)
             except TimeoutError as exc:
                 msg = f"GitHub REST API timed out after {_GITHUB_API_TIMEOUT_SECS:.0f}s"
                 raise GitHubError(msg) from exc
-            _raise_for_status(response)
-            page = response.json()
+            page, link = _read_conditional(response, etag_key, etag_entry)
             if isinstance(page, list):
                 results.extend(page)
             elif page is not None:
                 results.append(page)
-            next_url = _parse_next_link(response.headers.get("link", ""))
+            next_url = _parse_next_link(link)
             first = False
     finally:
         try:
@@ -11,6 +11,7 @@ import base64
 import json
 import os
 import shutil
+import stat
 import subprocess  # noqa: S404
 import sys
 from pathlib import Path
@@ -66,6 +67,28 @@ def _build_server_config(
     )
 
 
+def _atomic_write_json(path: Path, data: dict) -> None:
+    """Write JSON to *path* via a sibling temp file and rename.
+
+    An interrupted write never leaves a truncated file behind. Symlinks are
+    resolved first so a symlinked config stays a symlink, and an existing
+    file's permissions carry over — client configs often hold tokens.
+    """
+    target = path.resolve()
+    tmp_path = target.with_name(f"{target.name}.tmp")
+    mode = stat.S_IMODE(target.stat().st_mode) if target.exists() else None
+    try:
+        # Existing configs: start owner-only, then copy the target's mode
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600 if mode is not None else 0o666)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(json.dumps(data, indent=2))
+        if mode is not None:
+            tmp_path.chmod(mode)
+        tmp_path.replace(target)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
 def _write_config_file(
     config_path: Path,
     server_config: StdioMCPServer,
@@ -86,7 +109,7 @@ def _write_config_file(
 
         config.setdefault("mcpServers", {})
         config["mcpServers"][SERVER_NAME] = server_config.model_dump(exclude_none=True)
-        config_path.write_text(json.dumps(config, indent=2), encoding="utf-8")
+        _atomic_write_json(config_path, config)
     except Exception as exc:
         rprint(f"[red]Failed to install in {client_name}: {exc}[/red]")
         return False
@@ -266,8 +289,8 @@ def cmd_cursor(
     """Install codereviewbuddy in Cursor (opens deeplink)."""
     server_config = _build_server_config(env_vars=env, env_file=env_file)
 
-    config_json = server_config.model_dump_json(exclude_none=True, exclude_defaults=True)
-    config_b64 = base64.urlsafe_b64encode(config_json.encode()).decode()
+    config_json = server_config.model_dump_json(exclude_none=True, exclude_defaults=True).encode()
+    config_b64 = base64.urlsafe_b64encode(config_json).decode("ascii")
     encoded_name = quote(SERVER_NAME, safe="")
     deeplink = f"cursor://anysphere.cursor-deeplink/mcp/install?name={encoded_name}&config={config_b64}"
 
@@ -353,9 +376,11 @@ def cmd_mcp_json(
     if server_config.env:
         config_dict["env"] = server_config.env
 
-    output = json.dumps({SERVER_NAME: config_dict}, indent=2)
+    payload = {SERVER_NAME: config_dict}
 
     if copy:
+        # Compact single line — pastes cleanly into any JSON config
+        output = json.dumps(payload, separators=(",", ":"))
         try:
             import pyperclip  # noqa: PLC0415
 
@@ -367,4 +392,4 @@ def cmd_mcp_json(
             sys.exit(1)
     else:
         # Print raw JSON to stdout (no rich formatting — for piping)
-        print(output)  # noqa: T201
+        print(json.dumps(payload, indent=2))  # noqa: T201
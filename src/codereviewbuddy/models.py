@@ -3,21 +3,19 @@
 from __future__ import annotations
 
 from datetime import datetime  # noqa: TC003 - Pydantic needs this at runtime
-from enum import StrEnum
+from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-
-class CommentStatus(StrEnum):
-    """Status of a review thread."""
-
-    RESOLVED = "resolved"
-    UNRESOLVED = "unresolved"
+# Status of a review thread
+CommentStatus = Literal["resolved", "unresolved"]
 
 
 class ReviewComment(BaseModel):
     """A single comment within a review thread."""
 
+    model_config = ConfigDict(frozen=True)
+
     author: str = Field(description="GitHub username of the comment author")
     body: str = Field(description="Comment body text")
     created_at: datetime | None = Field(default=None, description="When the comment was posted")
@@ -27,13 +25,15 @@ class ReviewComment(BaseModel):
 class ReviewThread(BaseModel):
     """A review thread on a pull request."""
 
+    model_config = ConfigDict(frozen=True)
+
     thread_id: str = Field(description="GraphQL node ID (PRRT_...) for resolving")
     pr_number: int = Field(description="PR number this thread belongs to")
     status: CommentStatus = Field(description="Whether the thread is resolved or not")
     file: str | None = Field(default=None, description="File path the comment is on")
     line: int | None = Field(default=None, description="Line number in the file")
     reviewer: str = Field(description="GitHub login of the user or bot that posted the first comment")
-    comments: list[ReviewComment] = Field(default_factory=list, description="Comments in this thread")
+    comments: tuple[ReviewComment, ...] = Field(default=(), description="Comments in this thread")
     is_pr_review: bool = Field(default=False, description="True for PR-level reviews (PRR_ IDs) — not resolvable via resolveReviewThread")
     is_outdated: bool = Field(default=False, description="True when the diff has changed since the comment was posted")
 
@@ -41,6 +41,8 @@ class ReviewThread(BaseModel):
 class StackPR(BaseModel):
     """A PR in a stack."""
 
+    model_config = ConfigDict(frozen=True)
+
     pr_number: int = Field(description="PR number")
     branch: str = Field(description="Branch name")
     title: str = Field(description="PR title")
@@ -164,6 +166,7 @@ class CIDiagnosisResult(BaseModel):
     url: str = Field(default="", description="URL to the workflow run")
     failures: list[CIJobFailure] = Field(default_factory=list, description="Failed jobs with extracted error details")
     next_steps: list[str] = Field(default_factory=list, description="Suggested next actions for fixing the CI failure")
+    logs_available: bool = Field(default=True, description="False if job logs could not be fetched, so error lines are missing")
     error: str | None = Field(default=None, description="Error message if diagnosis itself failed")
 
 
@@ -12,8 +12,10 @@ import importlib.util
 import json
 import logging
 import os
+import re
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated
+from urllib.parse import unquote, urlparse
 
 from fastmcp import FastMCP
 from fastmcp.server.dependencies import get_context
@@ -25,7 +27,7 @@ from fastmcp.server.middleware.timing import TimingMiddleware
 from fastmcp.utilities.async_utils import call_sync_fn_in_threadpool
 from pydantic import Field
 
-from codereviewbuddy import gh
+from codereviewbuddy import cache, gh, github_api
 from codereviewbuddy.config import get_config, load_config, set_config
 from codereviewbuddy.models import (
     CIDiagnosisResult,
@@ -56,6 +58,14 @@ _WORKSPACE_HELP = (
 )
 
 
+# Full error message per (has_pr, has_repo) combination that needs auto-detection
+_MISSING_PARAMS_HELP = {
+    (False, False): f"{_WORKSPACE_HELP}\nMissing: `pr_number`/`pr_numbers`, `repo`",
+    (False, True): f"{_WORKSPACE_HELP}\nMissing: `pr_number`/`pr_numbers`",
+    (True, False): f"{_WORKSPACE_HELP}\nMissing: `repo`",
+}
+
+
 async def _get_workspace_cwd(ctx: Context | None = None) -> str | None:
     """Resolve the user's workspace directory for ``gh`` CLI commands.
 
@@ -71,12 +81,10 @@ async def _get_workspace_cwd(ctx: Context | None = None) -> str | None:
         try:
             roots = await asyncio.wait_for(ctx.list_roots(), timeout=5.0)
             if roots:
-                from urllib.parse import unquote, urlparse  # noqa: PLC0415
-
                 parsed = urlparse(str(roots[0].uri))
                 if parsed.scheme == "file" and parsed.path:
                     path = unquote(parsed.path)
-                    logger.info("Workspace from MCP roots: %s", path)
+                    logger.debug("Workspace from MCP roots: %s", path)
                     return path
                 logger.warning(
                     "MCP root URI has unsupported scheme %r (expected 'file')",
@@ -129,14 +137,18 @@ def _check_auto_detect_prerequisites(
     if has_pr and has_repo:
         return  # all params explicit — no auto-detection needed
 
-    missing = []
-    if not has_pr:
-        missing.append("`pr_number`/`pr_numbers`")
-    if not has_repo:
-        missing.append("`repo`")
+    raise gh.GhError(_MISSING_PARAMS_HELP[has_pr, has_repo])
 
-    msg = f"{_WORKSPACE_HELP}\nMissing: {', '.join(missing)}"
-    raise gh.GhError(msg)
+
+async def _tool_context(*, has_pr: bool, has_repo: bool) -> tuple[Context, str | None]:
+    """Return the request context and workspace cwd, checking auto-detection is safe.
+
+    Common preamble for tools that may fall back to auto-detecting the PR or repo.
+    """
+    ctx = get_context()
+    cwd = await _get_workspace_cwd(ctx)
+    _check_auto_detect_prerequisites(cwd, has_pr=has_pr, has_repo=has_repo)
+    return ctx, cwd
 
 
 def _resolve_pr_number(pr_number: int | None, cwd: str | None = None) -> int:
@@ -164,6 +176,13 @@ def _resolve_thread_pr_number(
     return _resolve_pr_number(pr_number, cwd=cwd)
 
 
+async def _thread_pr_number(thread_id: str, pr_number: int | None, cwd: str | None, *, has_repo: bool) -> int | None:
+    """Async ``_resolve_thread_pr_number``, offloaded only when it must shell out to ``gh pr view``."""
+    if thread_id.startswith("PRRT_") or pr_number is not None:
+        return _resolve_thread_pr_number(thread_id, pr_number, cwd, has_repo=has_repo)
+    return await call_sync_fn_in_threadpool(_resolve_thread_pr_number, thread_id, pr_number, cwd, has_repo=has_repo)
+
+
 @lifespan
 async def check_gh_cli(server: FastMCP) -> AsyncIterator[dict[str, object] | None]:  # noqa: RUF029
     """Verify gh CLI is installed and authenticated on server startup."""
@@ -245,6 +264,13 @@ mcp = FastMCP(
 )
 
 
+# Error classifiers for _recovery_error, compiled once at import
+_RATE_LIMIT_RE = re.compile(r"rate limit|403", re.IGNORECASE)
+_NOT_FOUND_RE = re.compile(r"not found|could not resolve|404", re.IGNORECASE)
+_WORKSPACE_RE = re.compile(r"workspace", re.IGNORECASE)  # also matches CRB_WORKSPACE
+_GRAPHQL_RE = re.compile(r"graphql", re.IGNORECASE)
+
+
 def _recovery_error(  # noqa: PLR0911
     exc: Exception,
     *,
@@ -257,21 +283,20 @@ def _recovery_error(  # noqa: PLR0911
     Classifies errors into categories and suggests specific next steps
     so agents can self-correct instead of retrying blindly.
     """
-    msg = str(exc)
-    low = msg.lower()
-
     # Auth errors — not retryable, needs human intervention
     if isinstance(exc, gh.GhNotFoundError):
         return f"{tool_name} failed: gh CLI not found. Install it from https://cli.github.com/ then run: gh auth login"
     if isinstance(exc, gh.GhNotAuthenticatedError):
         return f"{tool_name} failed: gh CLI not authenticated. Run: gh auth login"
 
+    msg = str(exc)
+
     # Rate limit — retryable after delay
-    if "rate limit" in low or "403" in msg:
+    if _RATE_LIMIT_RE.search(msg):
         return f"{tool_name} failed: GitHub API rate limit hit. Wait 60 seconds and retry."
 
     # Not found — likely bad PR number or repo
-    if "not found" in low or "could not resolve" in low or "404" in msg:
+    if _NOT_FOUND_RE.search(msg):
         hints = [f"{tool_name} failed: resource not found — {msg}."]
         if pr_number:
             hints.append(f"Verify PR #{pr_number} exists and is open.")
@@ -279,14 +304,14 @@ def _recovery_error(  # noqa: PLR0911
         return " ".join(hints)
 
     # Workspace detection failure
-    if "workspace" in low or "CRB_WORKSPACE" in msg:
+    if _WORKSPACE_RE.search(msg):
         return (
             f"{tool_name} failed: workspace not detected. "
             "Pass repo='owner/repo' explicitly, or set CRB_WORKSPACE in your MCP client config."
         )
 
     # GraphQL errors
-    if "graphql" in low:
+    if _GRAPHQL_RE.search(msg):
         return f"{tool_name} failed: GitHub GraphQL error — {msg}. This may be a transient issue; retry once."
 
     # Generic fallback — still better than bare "Error: ..."
@@ -298,6 +323,36 @@ def _recovery_error(  # noqa: PLR0911
     return " ".join(parts)
 
 
+# Failure modes tools are expected to hit at runtime (as opposed to bugs)
+_EXPECTED_TOOL_ERRORS = (gh.GhError, github_api.GitHubError, TimeoutError)
+
+
+def _tool_failure(
+    exc: Exception,
+    *,
+    tool_name: str,
+    pr_number: int | None = None,
+    repo: str | None = None,
+    thread_id: str | None = None,
+) -> str:
+    """Log a failed tool call and return its recovery message.
+
+    Shared ``except Exception`` path for every tool so logging and error
+    classification stay in one place. Expected failures (``gh``/GitHub API
+    errors, timeouts) log a one-line warning — they arrive in bursts under
+    rate limits and their traceback adds nothing, so it is only attached at
+    DEBUG. Anything else is a bug and always logs its traceback.
+    """
+    where = f"repo={repo}, pr={pr_number}" + (f", thread={thread_id}" if thread_id else "")
+    if not isinstance(exc, _EXPECTED_TOOL_ERRORS):
+        logger.error("%s failed (%s)", tool_name, where, exc_info=exc)
+    elif logger.isEnabledFor(logging.DEBUG):
+        logger.warning("%s failed (%s)", tool_name, where, exc_info=exc)
+    else:
+        logger.warning("%s failed (%s): %s", tool_name, where, exc)
+    return _recovery_error(exc, tool_name=tool_name, pr_number=pr_number, repo=repo)
+
+
 mcp.add_middleware(ErrorHandlingMiddleware(include_traceback=True, transform_errors=True))
 mcp.add_middleware(TimingMiddleware())
 mcp.add_middleware(LoggingMiddleware(include_payloads=True, max_payload_length=500))
@@ -323,13 +378,7 @@ async def pr_reviews(owner: str, repo: str, pr_number: int) -> str:
         logger.warning("pr_reviews cancelled for %s/%s#%s", owner, repo, pr_number)
         raise
     except Exception as exc:
-        logger.exception("pr_reviews failed for %s/%s#%s", owner, repo, pr_number)
-        error_msg = _recovery_error(
-            exc,
-            tool_name="pr_reviews",
-            pr_number=pr_number,
-            repo=f"{owner}/{repo}",
-        )
+        error_msg = _tool_failure(exc, tool_name="pr_reviews", pr_number=pr_number, repo=f"{owner}/{repo}")
         return json.dumps({"error": error_msg})
 
 
@@ -352,8 +401,7 @@ async def get_thread(thread_id: str) -> ReviewThread | str:
     try:
         return await comments.get_thread(thread_id)
     except Exception as exc:
-        logger.exception("get_thread failed for %s", thread_id)
-        return _recovery_error(exc, tool_name="get_thread")
+        return _tool_failure(exc, tool_name="get_thread", thread_id=thread_id)
     except asyncio.CancelledError:
         logger.warning("get_thread cancelled for %s", thread_id)
         return "Cancelled"
@@ -382,11 +430,10 @@ async def reply_to_comment(
     try:
         ctx = get_context()
         cwd = await _get_workspace_cwd(ctx)
-        pr_number = _resolve_thread_pr_number(thread_id, pr_number, cwd, has_repo=repo is not None)
+        pr_number = await _thread_pr_number(thread_id, pr_number, cwd, has_repo=repo is not None)
         return await comments.reply_to_comment(pr_number, thread_id, body, repo=repo, cwd=cwd)
     except Exception as exc:
-        logger.exception("reply_to_comment failed for %s on PR #%s", thread_id, pr_number)
-        return _recovery_error(exc, tool_name="reply_to_comment", pr_number=pr_number, repo=repo)
+        return _tool_failure(exc, tool_name="reply_to_comment", pr_number=pr_number, repo=repo, thread_id=thread_id)
     except asyncio.CancelledError:
         logger.warning("reply_to_comment cancelled for %s on PR #%s", thread_id, pr_number)
         return "Cancelled"
@@ -410,13 +457,10 @@ async def review_pr_descriptions(
         Analysis results for each PR's description.
     """
     try:
-        ctx = get_context()
-        cwd = await _get_workspace_cwd(ctx)
-        _check_auto_detect_prerequisites(cwd, has_pr=True, has_repo=repo is not None)
+        ctx, cwd = await _tool_context(has_pr=True, has_repo=repo is not None)
         return await descriptions.review_pr_descriptions(pr_numbers, repo=repo, cwd=cwd, ctx=ctx)
     except Exception as exc:
-        logger.exception("review_pr_descriptions failed")
-        return PRDescriptionReviewResult(error=_recovery_error(exc, tool_name="review_pr_descriptions", repo=repo))
+        return PRDescriptionReviewResult(error=_tool_failure(exc, tool_name="review_pr_descriptions", repo=repo))
     except asyncio.CancelledError:
         logger.warning("review_pr_descriptions cancelled")
         return PRDescriptionReviewResult(error="Cancelled")
@@ -442,13 +486,10 @@ async def summarize_review_status(
         Per-PR status with unresolved/resolved counts.
     """
     try:
-        ctx = get_context()
-        cwd = await _get_workspace_cwd(ctx)
-        _check_auto_detect_prerequisites(cwd, has_pr=pr_numbers is not None, has_repo=repo is not None)
+        ctx, cwd = await _tool_context(has_pr=pr_numbers is not None, has_repo=repo is not None)
         return await stack.summarize_review_status(pr_numbers=pr_numbers, repo=repo, cwd=cwd, ctx=ctx)
     except Exception as exc:
-        logger.exception("summarize_review_status failed")
-        return StackReviewStatusResult(error=_recovery_error(exc, tool_name="summarize_review_status", repo=repo))
+        return StackReviewStatusResult(error=_tool_failure(exc, tool_name="summarize_review_status", repo=repo))
     except asyncio.CancelledError:
         logger.warning("summarize_review_status cancelled")
         return StackReviewStatusResult(error="Cancelled")
@@ -475,13 +516,10 @@ async def list_recent_unresolved(
         Per-PR status with unresolved/resolved counts — same format as ``summarize_review_status``.
     """
     try:
-        ctx = get_context()
-        cwd = await _get_workspace_cwd(ctx)
-        _check_auto_detect_prerequisites(cwd, has_pr=True, has_repo=repo is not None)
+        ctx, cwd = await _tool_context(has_pr=True, has_repo=repo is not None)
         return await stack.list_recent_unresolved(repo=repo, limit=limit, cwd=cwd, ctx=ctx)
     except Exception as exc:
-        logger.exception("list_recent_unresolved failed")
-        return StackReviewStatusResult(error=_recovery_error(exc, tool_name="list_recent_unresolved", repo=repo))
+        return StackReviewStatusResult(error=_tool_failure(exc, tool_name="list_recent_unresolved", repo=repo))
     except asyncio.CancelledError:
         logger.warning("list_recent_unresolved cancelled")
         return StackReviewStatusResult(error="Cancelled")
@@ -508,13 +546,10 @@ async def stack_activity(
         StackActivityResult with merged chronological events and settled flag.
     """
     try:
-        ctx = get_context()
-        cwd = await _get_workspace_cwd(ctx)
-        _check_auto_detect_prerequisites(cwd, has_pr=pr_numbers is not None, has_repo=repo is not None)
+        ctx, cwd = await _tool_context(has_pr=pr_numbers is not None, has_repo=repo is not None)
         return await stack.stack_activity(pr_numbers=pr_numbers, repo=repo, cwd=cwd, ctx=ctx)
     except Exception as exc:
-        logger.exception("stack_activity failed")
-        return StackActivityResult(error=_recovery_error(exc, tool_name="stack_activity", repo=repo))
+        return StackActivityResult(error=_tool_failure(exc, tool_name="stack_activity", repo=repo))
     except asyncio.CancelledError:
         logger.warning("stack_activity cancelled")
         return StackActivityResult(error="Cancelled")
@@ -542,18 +577,29 @@ async def triage_review_comments(
         TriageResult with unresolved threads needing action.
     """
     try:
-        ctx = get_context()
-        cwd = await _get_workspace_cwd(ctx)
-        _check_auto_detect_prerequisites(cwd, has_pr=True, has_repo=repo is not None)
+        ctx, cwd = await _tool_context(has_pr=True, has_repo=repo is not None)
         return await comments.triage_review_comments(pr_numbers, repo=repo, owner_logins=owner_logins, cwd=cwd, ctx=ctx)
     except Exception as exc:
-        logger.exception("triage_review_comments failed")
-        return TriageResult(error=_recovery_error(exc, tool_name="triage_review_comments", repo=repo))
+        return TriageResult(error=_tool_failure(exc, tool_name="triage_review_comments", repo=repo))
     except asyncio.CancelledError:
         logger.warning("triage_review_comments cancelled")
         return TriageResult(error="Cancelled")
 
 
+async def _resolve_ci_target(pr_number: int | None, repo: str | None, run_id: int | None) -> tuple[int | None, str | None]:
+    """Return ``(pr_number, cwd)`` for ``diagnose_ci``, auto-detecting only what is missing.
+
+    An explicit ``run_id`` plus ``repo`` needs no workspace at all, so the
+    MCP roots round trip is skipped.
+    """
+    if run_id is not None and repo is not None:
+        return pr_number, None
+    _ctx, cwd = await _tool_context(has_pr=run_id is not None or pr_number is not None, has_repo=repo is not None)
+    if run_id is None and pr_number is None and cwd is not None:
+        pr_number = await call_sync_fn_in_threadpool(_resolve_pr_number, None, cwd=cwd)
+    return pr_number, cwd
+
+
 @mcp.tool(tags={"query"})
 async def diagnose_ci(
     pr_number: int | None = None,
@@ -574,22 +620,26 @@ async def diagnose_ci(
     Returns:
         Structured diagnosis with run info, failed jobs, failed steps, and extracted error lines.
     """
+    # A fully explicit run is served from the cache without a threadpool hop
+    # — polling loops ask for the same run repeatedly while fixing it.
+    key = cache.make_key("diagnose_ci", repo, run_id) if run_id is not None and repo is not None else None
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not cache._SENTINEL:
+            return cached
     try:
-        ctx = get_context()
-        cwd = await _get_workspace_cwd(ctx)
-        if run_id is None:
-            _check_auto_detect_prerequisites(cwd, has_pr=pr_number is not None, has_repo=repo is not None)
-            if pr_number is None and cwd is not None:
-                pr_number = _resolve_pr_number(None, cwd=cwd)
-        else:
-            _check_auto_detect_prerequisites(cwd, has_pr=True, has_repo=repo is not None)
-        return await call_sync_fn_in_threadpool(ci.diagnose_ci, pr_number=pr_number, repo=repo, run_id=run_id, cwd=cwd)
+        pr_number, cwd = await _resolve_ci_target(pr_number, repo, run_id)
+        result = await call_sync_fn_in_threadpool(ci.diagnose_ci, pr_number=pr_number, repo=repo, run_id=run_id, cwd=cwd)
     except Exception as exc:
-        logger.exception("diagnose_ci failed")
-        return CIDiagnosisResult(error=_recovery_error(exc, tool_name="diagnose_ci", pr_number=pr_number, repo=repo))
+        return CIDiagnosisResult(error=_tool_failure(exc, tool_name="diagnose_ci", pr_number=pr_number, repo=repo))
     except asyncio.CancelledError:
         logger.warning("diagnose_ci cancelled")
         return CIDiagnosisResult(error="Cancelled")
+    else:
+        # Only complete diagnoses — a failed log fetch is worth retrying
+        if key is not None and result.error is None and result.logs_available:
+            cache.put(key, result)
+        return result
 
 
 @mcp.tool(tags={"query"})
@@ -611,16 +661,14 @@ async def check_ci_status(
         Overall CI status with counts and per-check breakdown.
     """
     try:
-        ctx = get_context()
-        cwd = await _get_workspace_cwd(ctx)
-        _check_auto_detect_prerequisites(cwd, has_pr=pr_number is not None, has_repo=repo is not None)
-        pr_number = _resolve_pr_number(pr_number, cwd=cwd)
+        _ctx, cwd = await _tool_context(has_pr=pr_number is not None, has_repo=repo is not None)
+        if pr_number is None:
+            pr_number = await call_sync_fn_in_threadpool(_resolve_pr_number, None, cwd=cwd)
         return await call_sync_fn_in_threadpool(ci.check_ci_status, pr_number=pr_number, repo=repo, cwd=cwd)
     except Exception as exc:
-        logger.exception("check_ci_status failed")
         return CIStatusResult(
             overall="error",
-            error=_recovery_error(exc, tool_name="check_ci_status", pr_number=pr_number, repo=repo),
+            error=_tool_failure(exc, tool_name="check_ci_status", pr_number=pr_number, repo=repo),
         )
     except asyncio.CancelledError:
         logger.warning("check_ci_status cancelled")
@@ -15,30 +15,29 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# Lines matching these patterns are noise — strip them from error output.
-_NOISE_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"^##\[(end)?group\]"),
-    re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z\s*$"),
-    re.compile(r"^(Post job cleanup|Cleaning up orphan processes)"),
-    re.compile(r"^\s*shell:\s+/"),
-    re.compile(r"^\s*env:\s*$"),
-    re.compile(r"^\s+\w+:.*$"),  # indented env var lines
-]
-
-# Lines matching these patterns are interesting — keep them.
-_ERROR_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"##\[error\]", re.IGNORECASE),
-    re.compile(r"\berrors?\b", re.IGNORECASE),
-    re.compile(r"\bFailed\b", re.IGNORECASE),
-    re.compile(r"\bfailure\b", re.IGNORECASE),
-    re.compile(r"\bfatal\b", re.IGNORECASE),
-    re.compile(r"\bERROR:", re.IGNORECASE),
-    re.compile(r"\bTraceback\b"),
-    re.compile(r"\bAssertionError\b"),
-    re.compile(r"\bexception\b", re.IGNORECASE),
-    re.compile(r"exit code [1-9]"),
-    re.compile(r"Process completed with exit code [1-9]"),
-]
+# Lines matching this pattern are noise — strip them from error output.
+# One alternation per category so each line is scanned once, not once per pattern.
+_NOISE_RE = re.compile(
+    r"^(?:"
+    r"##\[(end)?group\]"
+    r"|\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z\s*$"
+    r"|Post job cleanup|Cleaning up orphan processes"
+    r"|\s*shell:\s+/"
+    r"|\s*env:\s*$"
+    r"|\s+\w+:.*$"  # indented env var lines
+    r")"
+)
+
+# Lines matching this pattern are interesting — keep them.
+_ERROR_RE = re.compile(
+    r"(?i:##\[error\]|\berrors?\b|\bfailed\b|\bfailure\b|\bfatal\b|\bexception\b)"
+    r"|\bTraceback\b"
+    r"|\bAssertionError\b"
+    r"|exit code [1-9]"
+)
+
+_TIMESTAMP_PREFIX_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z\s*")
+_JOB_PREFIX_RE = re.compile(r"^\S+\s+\S+\s+\S+\s+")
 
 _MAX_ERROR_LINES = 50
 _MAX_LOG_LINES = 2000
@@ -46,22 +45,22 @@ _MAX_LOG_LINES = 2000
 
 def _is_noise(line: str) -> bool:
     """Return True if the line is CI log noise."""
-    return any(p.search(line) for p in _NOISE_PATTERNS)
+    return _NOISE_RE.search(line) is not None
 
 
 def _is_error_line(line: str) -> bool:
     """Return True if the line looks like an error."""
-    return any(p.search(line) for p in _ERROR_PATTERNS)
+    return _ERROR_RE.search(line) is not None
 
 
 def _strip_timestamp(line: str) -> str:
     """Remove the leading ISO timestamp from a log line if present."""
-    return re.sub(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z\s*", "", line)
+    return _TIMESTAMP_PREFIX_RE.sub("", line, count=1)
 
 
 def _strip_job_prefix(line: str) -> str:
     """Remove the leading job-name prefix (e.g. 'prek    UNKNOWN STEP    ')."""
-    return re.sub(r"^\S+\s+\S+\s+\S+\s+", "", line)
+    return _JOB_PREFIX_RE.sub("", line, count=1)
 
 
 def _clean_log_line(line: str) -> str:
@@ -222,11 +221,13 @@ def diagnose_ci(
         )
 
     # Step 4: Get failed logs and extract errors
+    logs_available = True
     try:
         raw_logs = _get_failed_logs(actual_run_id, repo=repo, cwd=cwd)
     except gh.GhError as exc:
         logger.warning("Failed to fetch logs for run %d: %s", actual_run_id, exc)
         raw_logs = ""
+        logs_available = False
 
     error_lines = _extract_error_lines(raw_logs) if raw_logs else []
 
@@ -250,6 +251,7 @@ def diagnose_ci(
         url=url,
         failures=failures,
         next_steps=next_steps,
+        logs_available=logs_available,
     )
 
 
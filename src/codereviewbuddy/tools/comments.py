@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from typing import TYPE_CHECKING
@@ -11,7 +12,6 @@ from fastmcp.utilities.async_utils import call_sync_fn_in_threadpool
 from codereviewbuddy import gh, github_api
 from codereviewbuddy.config import get_config
 from codereviewbuddy.models import (
-    CommentStatus,
     ReviewComment,
     ReviewThread,
     TriageItem,
@@ -25,6 +25,8 @@ if TYPE_CHECKING:
 
     from fastmcp.server.context import Context
 
+    from codereviewbuddy.models import CommentStatus
+
 # GraphQL query to fetch review threads for a PR (paginated)
 _THREADS_QUERY = """
 query($owner: String!, $repo: String!, $pr: Int!, $cursor: String) {
@@ -56,6 +58,48 @@ query($owner: String!, $repo: String!, $pr: Int!, $cursor: String) {
 """
 
 
+# Max PRs per aliased batch query — keeps each response well under GitHub's node limit
+_TRIAGE_BATCH_SIZE = 20
+
+# First page of review threads, shared by every alias in a batch query
+_THREAD_PAGE_FRAGMENT = """
+fragment ThreadPage on PullRequest {
+  reviewThreads(first: 100) {
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      id
+      isResolved
+      isOutdated
+      comments(first: 10) {
+        nodes {
+          author { login }
+          body
+          createdAt
+          path
+          line
+          url
+        }
+      }
+    }
+  }
+}
+"""
+
+
+@functools.cache
+def _batch_threads_query(count: int) -> str:
+    """Build a query fetching the first thread page of ``count`` PRs, aliased ``pr0``..``prN``."""
+    var_defs = "".join(f", $pr{i}: Int!" for i in range(count))
+    aliases = "\n".join(f"    pr{i}: pullRequest(number: $pr{i}) {{ ...ThreadPage }}" for i in range(count))
+    return f"""
+query($owner: String!, $repo: String!{var_defs}) {{
+  repository(owner: $owner, name: $repo) {{
+{aliases}
+  }}
+}}
+{_THREAD_PAGE_FRAGMENT}"""
+
+
 # -- Body stripping (issue #99) ------------------------------------------------
 
 # HTML comment blocks injected by reviewer bots (badges, metadata, etc.)
@@ -114,7 +158,7 @@ def _parse_threads(raw_threads: list[dict[str, Any]], pr_number: int) -> list[Re
         author = (first_comment.get("author") or {}).get("login", "unknown")
         file_path = first_comment.get("path")
 
-        comments = [
+        comments = tuple(
             ReviewComment(
                 author=(c.get("author") or {}).get("login", "unknown"),
                 body=_strip_comment_body(c.get("body", "")),
@@ -122,13 +166,13 @@ def _parse_threads(raw_threads: list[dict[str, Any]], pr_number: int) -> list[Re
                 url=c.get("url", ""),
             )
             for c in comments_raw
-        ]
+        )
 
         threads.append(
             ReviewThread(
                 thread_id=node["id"],
                 pr_number=pr_number,
-                status=CommentStatus.RESOLVED if node.get("isResolved") else CommentStatus.UNRESOLVED,
+                status="resolved" if node.get("isResolved") else "unresolved",
                 file=file_path,
                 line=first_comment.get("line"),
                 reviewer=author,
@@ -141,10 +185,10 @@ def _parse_threads(raw_threads: list[dict[str, Any]], pr_number: int) -> list[Re
 
 # Map GitHub review states to our comment status
 _REVIEW_STATE_MAP: dict[str, CommentStatus] = {
-    "APPROVED": CommentStatus.RESOLVED,
-    "DISMISSED": CommentStatus.RESOLVED,
-    "CHANGES_REQUESTED": CommentStatus.UNRESOLVED,
-    "COMMENTED": CommentStatus.UNRESOLVED,
+    "APPROVED": "resolved",
+    "DISMISSED": "resolved",
+    "CHANGES_REQUESTED": "unresolved",
+    "COMMENTED": "unresolved",
 }
 
 
@@ -152,12 +196,12 @@ async def _fetch_raw_threads(
     owner: str,
     repo_name: str,
     pr_number: int,
-    cwd: str | None,  # noqa: ARG001
     ctx: Context | None,
+    *,
+    cursor: str | None = None,
 ) -> list[dict[str, Any]]:
-    """Paginate through all review threads for a PR via GraphQL."""
+    """Paginate through all review threads for a PR via GraphQL, optionally from ``cursor``."""
     raw_threads: list[dict[str, Any]] = []
-    cursor = None
     page = 0
 
     while True:
@@ -184,16 +228,50 @@ async def _fetch_raw_threads(
     return raw_threads
 
 
-async def _get_inline_threads(
+async def _fetch_raw_threads_batch(
     owner: str,
     repo_name: str,
-    pr_number: int,
-    cwd: str | None = None,
+    pr_numbers: list[int],
+    ctx: Context | None,
+) -> dict[int, list[dict[str, Any]]]:
+    """Fetch review threads for many PRs, one aliased GraphQL query per batch.
+
+    Each batch returns the first thread page of up to ``_TRIAGE_BATCH_SIZE``
+    PRs in a single round trip, and batches run concurrently. Only PRs with
+    more than one page of threads need follow-up requests via ``_fetch_raw_threads``.
+    """
+    unique = list(dict.fromkeys(pr_numbers))
+    batches = [unique[start : start + _TRIAGE_BATCH_SIZE] for start in range(0, len(unique), _TRIAGE_BATCH_SIZE)]
+
+    async def _fetch_batch(batch: list[int]) -> dict[int, list[dict[str, Any]]]:
+        variables: dict[str, Any] = {"owner": owner, "repo": repo_name}
+        variables.update({f"pr{i}": pr_number for i, pr_number in enumerate(batch)})
+        result = await github_api.graphql(_batch_threads_query(len(batch)), variables=variables)
+        repo_data = result.get("data", {}).get("repository") or {}
+
+        raw: dict[int, list[dict[str, Any]]] = {}
+        for i, pr_number in enumerate(batch):
+            threads_data = (repo_data.get(f"pr{i}") or {}).get("reviewThreads", {})
+            nodes = list(threads_data.get("nodes", []))
+            page_info = threads_data.get("pageInfo", {})
+            if page_info.get("hasNextPage") and page_info.get("endCursor"):
+                nodes.extend(await _fetch_raw_threads(owner, repo_name, pr_number, ctx, cursor=page_info["endCursor"]))
+            raw[pr_number] = nodes
+        return raw
+
+    results = await github_api.gather_limited(_fetch_batch, batches, progress=ctx.report_progress if ctx else None)
+    return {pr_number: nodes for raw in results for pr_number, nodes in raw.items()}
+
+
+async def _get_inline_threads_batch(
+    owner: str,
+    repo_name: str,
+    pr_numbers: list[int],
     ctx: Context | None = None,
-) -> list[ReviewThread]:
-    """Fetch only inline review threads (PRRT_) for a PR."""
-    raw = await _fetch_raw_threads(owner, repo_name, pr_number, cwd, ctx)
-    return _parse_threads(raw, pr_number)
+) -> dict[int, list[ReviewThread]]:
+    """Fetch only inline review threads (PRRT_) for each PR, keyed by PR number."""
+    raw = await _fetch_raw_threads_batch(owner, repo_name, pr_numbers, ctx)
+    return {pr_number: _parse_threads(nodes, pr_number) for pr_number, nodes in raw.items()}
 
 
 # GraphQL query to fetch a single thread/review/comment by node ID
@@ -259,7 +337,7 @@ def _node_to_review_thread(node: dict[str, Any], thread_id: str) -> ReviewThread
         login = (node.get("author") or {}).get("login", "unknown")
         raw_body = (node.get("body") or "").strip()
         state = node.get("state", "COMMENTED")
-        status = _REVIEW_STATE_MAP.get(state, CommentStatus.UNRESOLVED)
+        status = _REVIEW_STATE_MAP.get(state, "unresolved")
         return ReviewThread(
             thread_id=thread_id,
             pr_number=pr_number,
@@ -267,14 +345,14 @@ def _node_to_review_thread(node: dict[str, Any], thread_id: str) -> ReviewThread
             file=None,
             line=None,
             reviewer=login,
-            comments=[
+            comments=(
                 ReviewComment(
                     author=login,
                     body=_strip_comment_body(raw_body) if raw_body else "",
                     created_at=node.get("submittedAt"),
                     url=node.get("url", ""),
                 ),
-            ],
+            ),
             is_pr_review=True,
         )
 
@@ -284,18 +362,18 @@ def _node_to_review_thread(node: dict[str, Any], thread_id: str) -> ReviewThread
         return ReviewThread(
             thread_id=thread_id,
             pr_number=(node.get("issue") or {}).get("number", 0),
-            status=CommentStatus.UNRESOLVED,
+            status="unresolved",
             file=None,
             line=None,
             reviewer=login,
-            comments=[
+            comments=(
                 ReviewComment(
                     author=login,
                     body=_strip_comment_body(raw_body) if raw_body else "",
                     created_at=node.get("createdAt"),
                     url=node.get("url", ""),
                 ),
-            ],
+            ),
             is_pr_review=True,
         )
 
@@ -494,23 +572,16 @@ async def triage_review_comments(
     else:
         owner, repo_name = await call_sync_fn_in_threadpool(gh.get_repo_info, cwd=cwd)
 
-    total = len(pr_numbers)
-    for i, pr_number in enumerate(pr_numbers):
-        if ctx and total:
-            await ctx.report_progress(i, total)
+    threads_by_pr = await _get_inline_threads_batch(owner, repo_name, pr_numbers, ctx=ctx) if pr_numbers else {}
 
-        threads = await _get_inline_threads(owner, repo_name, pr_number, cwd=cwd, ctx=ctx)
-
-        for thread in threads:
-            if thread.status != CommentStatus.UNRESOLVED:
+    for pr_number in pr_numbers:
+        for thread in threads_by_pr.get(pr_number, []):
+            if thread.status != "unresolved":
                 continue
             if _has_owner_reply(thread, owners):
                 continue
             items.append(_thread_to_triage_item(thread))
 
-    if ctx and total:
-        await ctx.report_progress(total, total)
-
     next_steps, message = _build_triage_hints(items)
 
     return TriageResult(
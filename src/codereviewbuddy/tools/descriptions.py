@@ -124,27 +124,20 @@ async def review_pr_descriptions(
     if not config.pr_descriptions.enabled:
         return PRDescriptionReviewResult(error="PR description tools are disabled in config")
 
-    descriptions: list[PRDescriptionInfo] = []
-    total = len(pr_numbers)
-
-    for i, pr_number in enumerate(pr_numbers):
-        if ctx and total:
-            await ctx.report_progress(i, total)
+    async def _review(pr_number: int) -> PRDescriptionInfo:
         try:
             data = await _fetch_pr_info(pr_number, repo=repo, cwd=cwd)
-            descriptions.append(_analyze_pr(data))
         except Exception as exc:
-            descriptions.append(
-                PRDescriptionInfo(
-                    pr_number=pr_number,
-                    title="",
-                    error=f"Failed to fetch PR #{pr_number}: {exc}",
-                )
+            return PRDescriptionInfo(
+                pr_number=pr_number,
+                title="",
+                error=f"Failed to fetch PR #{pr_number}: {exc}",
             )
+        return _analyze_pr(data)
+
+    descriptions = await github_api.gather_limited(_review, pr_numbers, progress=ctx.report_progress if ctx else None)
 
-    if ctx and total:
-        await ctx.report_progress(total, total)
     if ctx:
-        await ctx.info(f"Reviewed {total} PR description(s)")
+        await ctx.info(f"Reviewed {len(pr_numbers)} PR description(s)")
 
     return PRDescriptionReviewResult(descriptions=descriptions)
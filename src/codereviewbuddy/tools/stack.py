@@ -442,21 +442,15 @@ async def summarize_review_status(
     if not pr_numbers:
         return StackReviewStatusResult(error="No PRs to summarize")
 
-    summaries: list[PRReviewStatusSummary] = []
-    total = len(pr_numbers)
-
-    for i, pr_num in enumerate(pr_numbers):
-        if ctx and total:
-            await ctx.report_progress(i, total)
+    async def _summarize(pr_num: int) -> PRReviewStatusSummary | None:
         try:
-            summary = await fetch_pr_summary(owner, repo_name, pr_num, cwd=cwd)
+            return await fetch_pr_summary(owner, repo_name, pr_num, cwd=cwd)
         except ValueError:
             logger.warning("PR #%d not found in %s/%s, skipping", pr_num, owner, repo_name)
-            continue
-        summaries.append(summary)
+            return None
 
-    if ctx and total:
-        await ctx.report_progress(total, total)
+    results = await github_api.gather_limited(_summarize, pr_numbers, progress=ctx.report_progress if ctx else None)
+    summaries = [s for s in results if s is not None]
 
     next_steps, focus_pr, total_unresolved = _build_status_hints(summaries)
 
@@ -531,22 +525,17 @@ async def list_recent_unresolved(
     if not merged_prs:
         return StackReviewStatusResult(prs=[], total_unresolved=0)
 
-    summaries: list[PRReviewStatusSummary] = []
-    total = len(merged_prs)
-
-    for i, pr in enumerate(merged_prs):
-        if ctx and total:
-            await ctx.report_progress(i, total)
+    async def _summarize(pr_num: int) -> PRReviewStatusSummary | None:
         try:
-            summary = await fetch_pr_summary(owner, repo_name, pr["number"], cwd=cwd)
+            return await fetch_pr_summary(owner, repo_name, pr_num, cwd=cwd)
         except ValueError:
-            logger.warning("PR #%d not found in %s/%s, skipping", pr["number"], owner, repo_name)
-            continue
-        if summary.unresolved > 0:
-            summaries.append(summary)
+            logger.warning("PR #%d not found in %s/%s, skipping", pr_num, owner, repo_name)
+            return None
 
-    if ctx and total:
-        await ctx.report_progress(total, total)
+    results = await github_api.gather_limited(
+        _summarize, [pr["number"] for pr in merged_prs], progress=ctx.report_progress if ctx else None
+    )
+    summaries = [s for s in results if s is not None and s.unresolved > 0]
 
     total_unresolved = sum(s.unresolved for s in summaries)
 
@@ -687,17 +676,12 @@ async def stack_activity(
     if not pr_numbers:
         return StackActivityResult(error="No PRs to fetch activity for")
 
-    all_events: list[ActivityEvent] = []
-    total = len(pr_numbers)
-
-    for i, pr_num in enumerate(pr_numbers):
-        if ctx and total:
-            await ctx.report_progress(i, total)
+    async def _events(pr_num: int) -> list[ActivityEvent]:
         raw = await _fetch_timeline(owner, repo_name, pr_num, cwd=cwd)
-        all_events.extend(_parse_timeline_events(raw, pr_num))
+        return _parse_timeline_events(raw, pr_num)
 
-    if ctx and total:
-        await ctx.report_progress(total, total)
+    per_pr = await github_api.gather_limited(_events, pr_numbers, progress=ctx.report_progress if ctx else None)
+    all_events = [event for events in per_pr for event in events]
 
     # Sort chronologically
     all_events.sort(key=lambda e: e.time)
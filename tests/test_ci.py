@@ -255,6 +255,7 @@ class TestDiagnoseCI:
         assert result.run_id == 222
         assert len(result.failures) == 1
         assert result.failures[0].error_lines == []
+        assert result.logs_available is False
         assert result.error is None
 
     def test_multi_job_failure_splits_errors(self, mocker: MockerFixture):
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock
 
 import pytest
+from pydantic import ValidationError
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
@@ -128,6 +129,7 @@ class TestParseThreads:
         assert t.file == "src/codereviewbuddy/gh.py"
         assert t.line == 42
         assert t.reviewer == "ai-reviewer-a[bot]"
+        assert isinstance(t.comments, tuple)
         assert len(t.comments) == 1
         assert t.comments[0].author == "ai-reviewer-a[bot]"
 
@@ -186,6 +188,13 @@ class TestParseThreads:
         assert len(threads) == 1
         assert threads[0].comments[0].author == "unknown"
 
+    def test_parsed_threads_are_immutable(self):
+        thread = _parse_threads([SAMPLE_THREAD_NODE], pr_number=42)[0]
+        with pytest.raises(ValidationError):
+            thread.status = "resolved"
+        with pytest.raises(ValidationError):
+            thread.comments[0].body = "edited"
+
 
 class TestNodeToReviewThread:
     """Tests for _node_to_review_thread — GraphQL node response parsing."""
@@ -306,7 +315,7 @@ class TestGraphQLErrorChecks:
         )
 
         with pytest.raises(GitHubError, match="Something went wrong"):
-            await _fetch_raw_threads("owner", "repo", 42, cwd=None, ctx=None)
+            await _fetch_raw_threads("owner", "repo", 42, ctx=None)
 
     async def test_fetch_raw_threads_ok_without_errors(self, mocker: MockerFixture):
         """_fetch_raw_threads should work normally when no GraphQL errors."""
@@ -318,7 +327,7 @@ class TestGraphQLErrorChecks:
             return_value=SAMPLE_GRAPHQL_RESPONSE,
         )
 
-        result = await _fetch_raw_threads("owner", "repo", 42, cwd=None, ctx=None)
+        result = await _fetch_raw_threads("owner", "repo", 42, ctx=None)
         assert len(result) == 2
 
 
@@ -227,6 +227,9 @@ class TestCheckAuth:
 
 
 class TestGetCurrentPrNumber:
+    def setup_method(self):
+        cache.clear()
+
     def test_success(self, mocker: MockerFixture):
         _patch_run(mocker, stdout="42\n")
         assert get_current_pr_number() == 42
@@ -236,6 +239,35 @@ class TestGetCurrentPrNumber:
         with pytest.raises(GhError, match="no pull requests found"):
             get_current_pr_number()
 
+    def test_cached_per_branch(self, mocker: MockerFixture):
+        branch = "feat-a"
+        prs = {"feat-a": "42\n", "feat-b": "43\n"}
+
+        def fake_run(cmd: list[str], **_kwargs: object) -> subprocess.CompletedProcess[str]:
+            stdout = prs[branch] if cmd[0] == "gh" else f"{branch}\n"
+            return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=stdout, stderr="")
+
+        mocker.patch("codereviewbuddy.gh.shutil.which", return_value="git")
+        mock = mocker.patch("codereviewbuddy.gh.subprocess.run", side_effect=fake_run)
+        assert get_current_pr_number(cwd="/repo") == 42
+        assert get_current_pr_number(cwd="/repo") == 42
+        assert sum(c.args[0][0] == "gh" for c in mock.call_args_list) == 1
+
+        branch = "feat-b"
+        assert get_current_pr_number(cwd="/repo") == 43
+
+    def test_detached_head_not_cached(self, mocker: MockerFixture):
+        def fake_run(cmd: list[str], **_kwargs: object) -> subprocess.CompletedProcess[str]:
+            if cmd[0] == "gh":
+                return subprocess.CompletedProcess(args=cmd, returncode=0, stdout="42\n", stderr="")
+            return subprocess.CompletedProcess(args=cmd, returncode=1, stdout="", stderr="")
+
+        mocker.patch("codereviewbuddy.gh.shutil.which", return_value="git")
+        mock = mocker.patch("codereviewbuddy.gh.subprocess.run", side_effect=fake_run)
+        get_current_pr_number(cwd="/repo")
+        get_current_pr_number(cwd="/repo")
+        assert sum(c.args[0][0] == "gh" for c in mock.call_args_list) == 2
+
 
 class TestParseRepo:
     def test_valid_repo(self):
@@ -261,8 +293,18 @@ class TestParseRepo:
 
 
 class TestGetRepoInfo:
+    def setup_method(self):
+        cache.clear()
+
     def test_success(self, mocker: MockerFixture):
         _patch_run(mocker, stdout="detailobsessed/codereviewbuddy\n")
         owner, repo = get_repo_info()
         assert owner == "detailobsessed"
         assert repo == "codereviewbuddy"
+
+    def test_cached_per_cwd(self, mocker: MockerFixture):
+        mock_run = _patch_run(mocker, stdout="detailobsessed/codereviewbuddy\n")
+        assert get_repo_info(cwd="/a") == get_repo_info(cwd="/a")
+        assert mock_run.call_count == 1
+        get_repo_info(cwd="/b")
+        assert mock_run.call_count == 2
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import respx
 from httpx import Response
 
+if TYPE_CHECKING:
+    from httpx import Request
+
 from codereviewbuddy.github_api import (
     _HTTP_FORBIDDEN,
     _HTTP_UNAUTHORIZED,
@@ -17,8 +22,10 @@ from codereviewbuddy.github_api import (
     _raise_for_status,
     _resolve_token_sync,
     download_bytes,
+    gather_limited,
     graphql,
     parse_repo,
+    reset_etags,
     reset_token,
     rest,
 )
@@ -127,6 +134,27 @@ class TestGetToken:
         assert result == "tok_test"
         reset_token()
 
+    async def test_concurrent_first_calls_resolve_once(self):
+        from codereviewbuddy import github_api
+
+        reset_token()
+        with patch.object(github_api, "_resolve_token_sync", return_value="tok_once") as resolve:
+            results = await asyncio.gather(*(github_api.get_token() for _ in range(5)))
+        assert results == ["tok_once"] * 5
+        resolve.assert_called_once()
+        reset_token()
+
+    async def test_failed_lookup_is_retried(self):
+        from codereviewbuddy import github_api
+
+        reset_token()
+        with patch.object(github_api, "_resolve_token_sync", side_effect=[OSError("gh crashed"), "tok_retry"]) as resolve:
+            with pytest.raises(OSError, match="gh crashed"):
+                await github_api.get_token()
+            assert await github_api.get_token() == "tok_retry"
+        assert resolve.call_count == 2
+        reset_token()
+
 
 # ---------------------------------------------------------------------------
 # _raise_for_status
@@ -181,6 +209,85 @@ class TestParseNextLink:
         assert _parse_next_link("") is None
 
 
+# ---------------------------------------------------------------------------
+# gather_limited
+# ---------------------------------------------------------------------------
+
+
+class TestGatherLimited:
+    async def test_preserves_input_order(self):
+        async def slow_echo(n: int) -> int:
+            await asyncio.sleep(0.01 * (3 - n))
+            return n
+
+        assert await gather_limited(slow_echo, [0, 1, 2]) == [0, 1, 2]
+
+    async def test_bounds_concurrency(self):
+        in_flight = 0
+        peak = 0
+
+        async def track(_n: int) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        with patch("codereviewbuddy.github_api._MAX_CONCURRENT_REQUESTS", 2), patch("codereviewbuddy.github_api._request_slots", None):
+            await gather_limited(track, list(range(6)))
+        assert peak == 2
+
+    async def test_limit_shared_across_concurrent_fan_outs(self):
+        in_flight = 0
+        peak = 0
+
+        async def track(_n: int) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        with patch("codereviewbuddy.github_api._MAX_CONCURRENT_REQUESTS", 2), patch("codereviewbuddy.github_api._request_slots", None):
+            await asyncio.gather(gather_limited(track, [1, 2, 3]), gather_limited(track, [4, 5, 6]))
+        assert peak == 2
+
+    async def test_reports_progress(self):
+        progress = AsyncMock()
+
+        async def echo(n: int) -> int:
+            await asyncio.sleep(0)
+            return n
+
+        await gather_limited(echo, [1, 2], progress=progress)
+        assert [c.args for c in progress.await_args_list] == [(0, 2), (1, 2), (2, 2)]
+
+    async def test_first_error_propagates_and_cancels_rest(self):
+        started: list[int] = []
+
+        async def work(n: int) -> int:
+            started.append(n)
+            if n == 0:
+                msg = "boom"
+                raise GitHubError(msg)
+            await asyncio.sleep(1)
+            return n
+
+        with (
+            patch("codereviewbuddy.github_api._MAX_CONCURRENT_REQUESTS", 1),
+            patch("codereviewbuddy.github_api._request_slots", None),
+            pytest.raises(GitHubError, match="boom"),
+        ):
+            await gather_limited(work, [0, 1, 2])
+        await asyncio.sleep(0)
+        assert started == [0]
+
+    async def test_empty_items(self):
+        progress = AsyncMock()
+        assert await gather_limited(AsyncMock(), [], progress=progress) == []
+        progress.assert_not_awaited()
+
+
 # ---------------------------------------------------------------------------
 # graphql
 # ---------------------------------------------------------------------------
@@ -337,6 +444,85 @@ class TestRest:
         reset_token()
         cache.clear()
 
+    async def test_get_revalidates_with_etag(self, monkeypatch):
+        from codereviewbuddy import cache
+
+        reset_token()
+        reset_etags()
+        monkeypatch.setenv("GH_TOKEN", "tok_test")
+        cache.clear()
+
+        with respx.mock:
+            route = respx.get("https://api.github.com/repos/o/r/pulls/1").mock(
+                side_effect=[
+                    Response(200, json={"number": 1}, headers={"etag": '"v1"'}),
+                    Response(304),
+                ],
+            )
+            first = await rest("/repos/o/r/pulls/1")
+            cache.clear()  # TTL expiry
+            second = await rest("/repos/o/r/pulls/1")
+
+        assert first == second == {"number": 1}
+        assert "if-none-match" not in route.calls[0].request.headers
+        assert route.calls[1].request.headers["if-none-match"] == '"v1"'
+        reset_token()
+        reset_etags()
+        cache.clear()
+
+    async def test_304_uses_entry_evicted_during_request(self, monkeypatch):
+        from codereviewbuddy import cache
+
+        reset_token()
+        reset_etags()
+        monkeypatch.setenv("GH_TOKEN", "tok_test")
+        cache.clear()
+
+        def _not_modified(_request: Request) -> Response:
+            reset_etags()  # a concurrent fan-out evicts the entry mid-flight
+            return Response(304)
+
+        url = "https://api.github.com/repos/o/r/pulls/1"
+        with respx.mock:
+            respx.get(url).mock(return_value=Response(200, json={"number": 1}, headers={"etag": '"v1"'}))
+            await rest("/repos/o/r/pulls/1")
+        cache.clear()
+        with respx.mock:
+            respx.get(url).mock(side_effect=_not_modified)
+            result = await rest("/repos/o/r/pulls/1")
+
+        assert result == {"number": 1}
+        reset_token()
+        reset_etags()
+        cache.clear()
+
+    async def test_paginate_304_keeps_following_stored_link(self, monkeypatch):
+        from codereviewbuddy import cache
+
+        reset_token()
+        reset_etags()
+        monkeypatch.setenv("GH_TOKEN", "tok_test")
+        cache.clear()
+
+        page2_url = "https://api.github.com/repos/o/r/pulls?page=2"
+        responses = [
+            Response(200, json=[{"number": 1}], headers={"etag": '"p1"', "link": f'<{page2_url}>; rel="next"'}),
+            Response(200, json=[{"number": 2}]),
+            Response(304),  # page 1 unchanged — no Link header on the 304
+            Response(200, json=[{"number": 3}]),
+        ]
+
+        with respx.mock:
+            respx.get(url__regex=r"https://api\.github\.com/repos/o/r/pulls").mock(side_effect=responses)
+            await rest("/repos/o/r/pulls", paginate=True)
+            cache.clear()
+            result = await rest("/repos/o/r/pulls", paginate=True)
+
+        assert result == [{"number": 1}, {"number": 3}]
+        reset_token()
+        reset_etags()
+        cache.clear()
+
 
 # ---------------------------------------------------------------------------
 # download_bytes
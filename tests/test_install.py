@@ -135,6 +135,47 @@ class TestWriteConfigFile:
         data = json.loads(config_path.read_text(encoding="utf-8"))
         assert SERVER_NAME in data["mcpServers"]
 
+    def test_leaves_no_temp_file(self, tmp_path: Path):
+        config_path = tmp_path / "mcp_config.json"
+        _write_config_file(config_path, _build_server_config(), client_name="Test")
+        assert [p.name for p in tmp_path.iterdir()] == ["mcp_config.json"]
+
+    def test_preserves_symlink(self, tmp_path: Path):
+        real = tmp_path / "real.json"
+        real.write_text("{}", encoding="utf-8")
+        link = tmp_path / "mcp_config.json"
+        link.symlink_to(real)
+
+        assert _write_config_file(link, _build_server_config(), client_name="Test") is True
+        assert link.is_symlink()
+        assert SERVER_NAME in json.loads(real.read_text(encoding="utf-8"))["mcpServers"]
+
+    @pytest.mark.skipif(
+        __import__("sys").platform == "win32",
+        reason="POSIX permissions only",
+    )
+    def test_preserves_file_mode(self, tmp_path: Path):
+        config_path = tmp_path / "mcp_config.json"
+        config_path.write_text("{}", encoding="utf-8")
+        config_path.chmod(0o600)
+
+        assert _write_config_file(config_path, _build_server_config(), client_name="Test") is True
+        assert config_path.stat().st_mode & 0o777 == 0o600
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path: Path, mocker: MockerFixture):
+        config_path = tmp_path / "mcp_config.json"
+        mocker.patch("codereviewbuddy.install.Path.replace", side_effect=OSError("disk full"))
+
+        assert _write_config_file(config_path, _build_server_config(), client_name="Test") is False
+        assert list(tmp_path.iterdir()) == []
+
+    def test_invalid_json_not_overwritten(self, tmp_path: Path):
+        config_path = tmp_path / "mcp_config.json"
+        config_path.write_text("{not json", encoding="utf-8")
+
+        assert _write_config_file(config_path, _build_server_config(), client_name="Test") is False
+        assert config_path.read_text(encoding="utf-8") == "{not json"
+
 
 # ---------------------------------------------------------------------------
 # Config path helpers
@@ -195,6 +236,16 @@ class TestMcpJsonCommand:
         data = json.loads(captured.out)
         assert "env" not in data[SERVER_NAME]
 
+    def test_copy_uses_compact_json(self, mocker: MockerFixture):
+        fake_pyperclip = mocker.MagicMock()
+        mocker.patch.dict("sys.modules", {"pyperclip": fake_pyperclip})
+        from codereviewbuddy.install import cmd_mcp_json
+
+        cmd_mcp_json(copy=True)
+        copied = fake_pyperclip.copy.call_args[0][0]
+        assert "\n" not in copied
+        assert json.loads(copied)[SERVER_NAME]["command"] == "uvx"
+
 
 # ---------------------------------------------------------------------------
 # Windsurf commands (filesystem-based — easy to test)
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import threading
 from typing import TYPE_CHECKING
 
 import pytest
@@ -10,13 +12,16 @@ import pytest
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
 
+from codereviewbuddy import cache
 from codereviewbuddy.gh import GhError, GhNotAuthenticatedError, GhNotFoundError
+from codereviewbuddy.models import CIDiagnosisResult
 from codereviewbuddy.server import (
     _check_auto_detect_prerequisites,
     _get_workspace_cwd,
     _recovery_error,
     _resolve_pr_number,
     _resolve_thread_pr_number,
+    _tool_failure,
     check_ci_status,
     check_fastmcp_runtime,
     check_prerequisites,
@@ -298,6 +303,41 @@ class TestRecoveryError:
         result = _recovery_error(Exception("HTTP 403 Forbidden"), tool_name="test_tool")
         assert "rate limit" in result
 
+    def test_classification_is_case_insensitive(self):
+        assert "rate limit" in _recovery_error(Exception("API RATE LIMIT exceeded"), tool_name="t")
+        assert "resource not found" in _recovery_error(Exception("Could Not Resolve to a PullRequest"), tool_name="t")
+        assert "workspace not detected" in _recovery_error(Exception("CRB_WORKSPACE unset"), tool_name="t")
+
+
+class TestToolFailure:
+    def test_logs_and_returns_recovery_message(self, caplog: pytest.LogCaptureFixture):
+        with caplog.at_level(logging.INFO, logger="codereviewbuddy.server"):
+            result = _tool_failure(GhError("boom"), tool_name="test_tool", pr_number=7, repo="o/r")
+        assert result == _recovery_error(GhError("boom"), tool_name="test_tool", pr_number=7, repo="o/r")
+        assert "test_tool failed (repo=o/r, pr=7): boom" in caplog.text
+
+    def test_logs_thread_id(self, caplog: pytest.LogCaptureFixture):
+        with caplog.at_level(logging.INFO, logger="codereviewbuddy.server"):
+            _tool_failure(GhError("boom"), tool_name="get_thread", thread_id="PRRT_abc")
+        assert "get_thread failed (repo=None, pr=None, thread=PRRT_abc): boom" in caplog.text
+
+    def test_expected_error_is_one_line_warning(self, caplog: pytest.LogCaptureFixture):
+        with caplog.at_level(logging.INFO, logger="codereviewbuddy.server"):
+            _tool_failure(GhError("rate limited"), tool_name="test_tool")
+        assert caplog.records[-1].levelno == logging.WARNING
+        assert caplog.records[-1].exc_info is None
+
+    def test_expected_error_traceback_attached_at_debug(self, caplog: pytest.LogCaptureFixture):
+        with caplog.at_level(logging.DEBUG, logger="codereviewbuddy.server"):
+            _tool_failure(GhError("rate limited"), tool_name="test_tool")
+        assert caplog.records[-1].exc_info is not None
+
+    def test_unexpected_error_keeps_traceback(self, caplog: pytest.LogCaptureFixture):
+        with caplog.at_level(logging.INFO, logger="codereviewbuddy.server"):
+            _tool_failure(RuntimeError("boom"), tool_name="test_tool")
+        assert caplog.records[-1].levelno == logging.ERROR
+        assert caplog.records[-1].exc_info is not None
+
 
 @pytest.mark.usefixtures("patch_server_context")
 class TestCancellationHandlers:
@@ -406,6 +446,84 @@ class TestErrorHandlers:
         assert "reply_to_comment failed" in result
 
 
+@pytest.mark.usefixtures("patch_server_context")
+class TestPrAutoDetectOffloaded:
+    """The blocking `gh pr view` lookup must run in a worker thread, not on the event loop."""
+
+    async def test_check_ci_status_resolves_pr_in_thread(self, mocker: MockerFixture):
+        loop_thread = threading.get_ident()
+        seen: list[int] = []
+
+        def fake_current_pr(**_kwargs):
+            seen.append(threading.get_ident())
+            return 7
+
+        mocker.patch("codereviewbuddy.server.gh.get_current_pr_number", side_effect=fake_current_pr)
+        mock_ci = mocker.patch("codereviewbuddy.server.ci.check_ci_status")
+        await check_ci_status()
+        assert seen
+        assert seen[0] != loop_thread
+        assert mock_ci.call_args.kwargs["pr_number"] == 7
+
+    async def test_reply_to_comment_resolves_pr_in_thread(self, mocker: MockerFixture):
+        loop_thread = threading.get_ident()
+        seen: list[int] = []
+
+        def fake_current_pr(**_kwargs):
+            seen.append(threading.get_ident())
+            return 7
+
+        mocker.patch("codereviewbuddy.server.gh.get_current_pr_number", side_effect=fake_current_pr)
+        mock_reply = mocker.patch("codereviewbuddy.server.comments.reply_to_comment", return_value="ok")
+        await reply_to_comment(thread_id="PRR_abc", body="test", repo="o/r")
+        assert seen
+        assert seen[0] != loop_thread
+        assert mock_reply.call_args.args[0] == 7
+
+    async def test_reply_to_comment_explicit_pr_stays_on_loop(self, mocker: MockerFixture):
+        offload = mocker.patch("codereviewbuddy.server.call_sync_fn_in_threadpool")
+        mocker.patch("codereviewbuddy.server.comments.reply_to_comment", return_value="ok")
+        await reply_to_comment(thread_id="PRRT_abc", body="test")
+        await reply_to_comment(thread_id="PRR_abc", body="test", pr_number=7, repo="o/r")
+        offload.assert_not_called()
+
+
+@pytest.mark.usefixtures("patch_server_context")
+class TestDiagnoseCiWorkspace:
+    def setup_method(self):
+        cache.clear()
+
+    async def test_explicit_run_and_repo_skip_workspace(self, mocker: MockerFixture):
+        workspace = mocker.patch("codereviewbuddy.server._get_workspace_cwd")
+        mock_ci = mocker.patch("codereviewbuddy.server.ci.diagnose_ci")
+        await diagnose_ci(run_id=123, repo="o/r")
+        workspace.assert_not_awaited()
+        assert mock_ci.call_args.kwargs["cwd"] is None
+
+    async def test_run_without_repo_uses_workspace(self, mocker: MockerFixture):
+        mock_ci = mocker.patch("codereviewbuddy.server.ci.diagnose_ci")
+        await diagnose_ci(run_id=123)
+        assert mock_ci.call_args.kwargs["cwd"] == "/tmp"  # noqa: S108
+
+    async def test_explicit_run_result_cached(self, mocker: MockerFixture):
+        mock_ci = mocker.patch("codereviewbuddy.server.ci.diagnose_ci", return_value=CIDiagnosisResult(run_id=123))
+        first = await diagnose_ci(run_id=123, repo="o/r")
+        assert await diagnose_ci(run_id=123, repo="o/r") is first
+        assert mock_ci.call_count == 1
+
+    async def test_result_without_logs_not_cached(self, mocker: MockerFixture):
+        mock_ci = mocker.patch("codereviewbuddy.server.ci.diagnose_ci", return_value=CIDiagnosisResult(run_id=123, logs_available=False))
+        await diagnose_ci(run_id=123, repo="o/r")
+        await diagnose_ci(run_id=123, repo="o/r")
+        assert mock_ci.call_count == 2
+
+    async def test_error_result_not_cached(self, mocker: MockerFixture):
+        mock_ci = mocker.patch("codereviewbuddy.server.ci.diagnose_ci", return_value=CIDiagnosisResult(error="boom"))
+        await diagnose_ci(run_id=123, repo="o/r")
+        await diagnose_ci(run_id=123, repo="o/r")
+        assert mock_ci.call_count == 2
+
+
 class TestResolveThreadPrNumber:
     """Tests for _resolve_thread_pr_number — PRRT_ vs PRR_/IC_ routing."""
 
@@ -9,7 +9,7 @@ from unittest.mock import AsyncMock
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
 
-from codereviewbuddy.models import CommentStatus, ReviewComment, ReviewThread
+from codereviewbuddy.models import ReviewComment, ReviewThread
 from codereviewbuddy.tools.comments import (
     _extract_title,
     _has_owner_reply,
@@ -33,19 +33,18 @@ def _thread(
     is_outdated: bool = False,
     extra_comments: list[ReviewComment] | None = None,
 ) -> ReviewThread:
-    comments = [
+    comments = (
         ReviewComment(
             author=author,
             body=body,
             created_at=datetime(2026, 2, 6, 10, 0, tzinfo=UTC),
         ),
-    ]
-    if extra_comments:
-        comments.extend(extra_comments)
+        *(extra_comments or ()),
+    )
     return ReviewThread(
         thread_id=thread_id,
         pr_number=pr_number,
-        status=CommentStatus.UNRESOLVED,
+        status="unresolved",
         file=file,
         line=line,
         reviewer=reviewer,
@@ -110,13 +109,13 @@ class TestHasOwnerReply:
 
 
 class TestTriageReviewComments:
-    """Integration tests that mock _get_inline_threads and verify triage logic."""
+    """Integration tests that mock _get_inline_threads_batch and verify triage logic."""
 
     def _mock_list(self, mocker: MockerFixture, threads: list[ReviewThread]) -> AsyncMock:
         return mocker.patch(
-            "codereviewbuddy.tools.comments._get_inline_threads",
+            "codereviewbuddy.tools.comments._get_inline_threads_batch",
             new_callable=AsyncMock,
-            return_value=threads,
+            side_effect=lambda _owner, _repo, pr_numbers, **_kwargs: dict.fromkeys(pr_numbers, threads),
         )
 
     async def test_unreplied_thread_appears(self, mocker: MockerFixture):
@@ -146,17 +145,15 @@ class TestTriageReviewComments:
         info_43 = _thread(thread_id="PRRT_43", pr_number=43, body="📝 **Info: Issue B**")
 
         mock = mocker.patch(
-            "codereviewbuddy.tools.comments._get_inline_threads",
+            "codereviewbuddy.tools.comments._get_inline_threads_batch",
             new_callable=AsyncMock,
-            side_effect=[
-                [bug_42],
-                [info_43],
-            ],
+            return_value={42: [bug_42], 43: [info_43]},
         )
 
         result = await triage_review_comments([42, 43], repo="o/r")
         assert result.total == 2
-        assert mock.call_count == 2
+        mock.assert_awaited_once()
+        assert mock.call_args.args[2] == [42, 43]
 
     async def test_empty_pr_list(self):
         """Empty PR list should return empty triage."""
@@ -245,7 +242,7 @@ class TestTriageReviewComments:
 GRAPHQL_RESPONSE_WITH_THREADS = {
     "data": {
         "repository": {
-            "pullRequest": {
+            "pr0": {
                 "title": "Test PR",
                 "url": "https://github.com/o/r/pull/42",
                 "reviewThreads": {
@@ -290,11 +287,25 @@ GRAPHQL_RESPONSE_WITH_THREADS = {
 }
 
 
+GRAPHQL_RESPONSE_PAGE_TWO = {
+    "data": {
+        "repository": {
+            "pullRequest": {
+                "reviewThreads": {
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    "nodes": GRAPHQL_RESPONSE_WITH_THREADS["data"]["repository"]["pr0"]["reviewThreads"]["nodes"],
+                }
+            }
+        }
+    }
+}
+
+
 class TestTriageNarrowIntegration:
     """Integration test that mocks only at the API boundary (ISM-147).
 
-    Exercises the real pipeline: triage → _get_inline_threads → _fetch_raw_threads
-    + _parse_threads, with only inline review threads.
+    Exercises the real pipeline: triage → _get_inline_threads_batch →
+    _fetch_raw_threads_batch + _parse_threads, with only inline review threads.
     """
 
     async def test_real_pipeline_filters_to_unresolved_inline(self, mocker: MockerFixture):
@@ -319,3 +330,69 @@ class TestTriageNarrowIntegration:
         assert inline.file == "src/main.py"
         assert inline.line == 10
         assert inline.is_outdated is True
+
+    async def test_one_query_per_batch(self, mocker: MockerFixture):
+        from codereviewbuddy.tools import comments
+
+        empty_page = {"reviewThreads": {"pageInfo": {"hasNextPage": False}, "nodes": []}}
+
+        async def fake_graphql(query: str, variables: dict) -> dict:  # noqa: RUF029
+            count = sum(1 for k in variables if k.startswith("pr"))
+            assert query == comments._batch_threads_query(count)
+            return {"data": {"repository": {f"pr{i}": empty_page for i in range(count)}}}
+
+        mock = mocker.patch("codereviewbuddy.tools.comments.github_api.graphql", side_effect=fake_graphql)
+        pr_numbers = list(range(1, comments._TRIAGE_BATCH_SIZE + 2))
+
+        result = await triage_review_comments(pr_numbers, repo="o/r", owner_logins=[])
+
+        assert result.total == 0
+        assert mock.await_count == 2  # full batch + the one PR that overflows it
+
+    async def test_batches_run_concurrently(self, mocker: MockerFixture):
+        import asyncio
+
+        from codereviewbuddy.tools import comments
+
+        empty_page = {"reviewThreads": {"pageInfo": {"hasNextPage": False}, "nodes": []}}
+        in_flight = 0
+        peak = 0
+
+        async def fake_graphql(_query: str, variables: dict) -> dict:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            count = sum(1 for k in variables if k.startswith("pr"))
+            return {"data": {"repository": {f"pr{i}": empty_page for i in range(count)}}}
+
+        mocker.patch("codereviewbuddy.tools.comments.github_api.graphql", side_effect=fake_graphql)
+
+        await triage_review_comments(list(range(1, 3 * comments._TRIAGE_BATCH_SIZE + 1)), repo="o/r", owner_logins=[])
+
+        assert peak == 3
+
+    async def test_paginates_past_first_batch_page(self, mocker: MockerFixture):
+        first_page = {
+            "data": {
+                "repository": {
+                    "pr0": {
+                        "reviewThreads": {
+                            "pageInfo": {"hasNextPage": True, "endCursor": "CUR1"},
+                            "nodes": [],
+                        }
+                    }
+                }
+            }
+        }
+        mock = mocker.patch(
+            "codereviewbuddy.tools.comments.github_api.graphql",
+            new_callable=AsyncMock,
+            side_effect=[first_page, GRAPHQL_RESPONSE_PAGE_TWO],
+        )
+
+        result = await triage_review_comments([42], repo="o/r", owner_logins=[])
+
+        assert result.total == 1
+        assert mock.await_args_list[1].kwargs["variables"] == {"owner": "o", "repo": "r", "pr": 42, "cursor": "CUR1"}